@@ -1,138 +1,230 @@
-import abc
+from contextlib import contextmanager
 from datetime import datetime
 import sqlite3
-from typing import List, Optional
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_TIPOS = ("Estándar", "Suite", "Deluxe")
+_DESCUENTOS = {"Estándar": 0.95, "Suite": 0.9, "Deluxe": 0.85}
+
+class Habitacion:
+    __slots__ = ("numero", "tipo", "precio_por_noche", "disponible")
 
-class Habitacion(abc.ABC):
     def __init__(self, numero: int, tipo: str, precio_por_noche: float):
         self.numero = numero
         self.tipo = tipo
         self.precio_por_noche = precio_por_noche
         self.disponible = True
 
-    @abc.abstractmethod
     def aplicar_descuento(self):
-        pass
-
-class HabitacionEstandar(Habitacion):
-    def __init__(self, numero: int, precio_por_noche: float):
-        super().__init__(numero, "Estándar", precio_por_noche)
-
-    def aplicar_descuento(self):
-        self.precio_por_noche *= 0.95
-
-class HabitacionSuite(Habitacion):
-    def __init__(self, numero: int, precio_por_noche: float):
-        super().__init__(numero, "Suite", precio_por_noche)
-
-    def aplicar_descuento(self):
-        self.precio_por_noche *= 0.9
-
-class HabitacionDeluxe(Habitacion):
-    def __init__(self, numero: int, precio_por_noche: float):
-        super().__init__(numero, "Deluxe", precio_por_noche)
-
-    def aplicar_descuento(self):
-        self.precio_por_noche *= 0.85
+        self.precio_por_noche *= _DESCUENTOS[self.tipo]
 
 class Cliente:
+    __slots__ = ("nombres", "apellidos", "dpi", "reservas", "reservas_by_hab")
+
     def __init__(self, nombres: str, apellidos: str, dpi: str):
         self.nombres = nombres
         self.apellidos = apellidos
         self.dpi = dpi
         self.reservas: List[Reserva] = []
+        self.reservas_by_hab: Dict[int, Reserva] = {}
 
 class Reserva:
+    __slots__ = ("id", "cliente", "habitacion", "_fecha_entrada", "_fecha_salida", "_fecha_entrada_iso",
+                 "_fecha_salida_iso", "estado")
+
     def __init__(self, cliente: Cliente, habitacion: Habitacion, fecha_entrada: datetime, fecha_salida: datetime):
         self.cliente = cliente
         self.habitacion = habitacion
         self.fecha_entrada = fecha_entrada
         self.fecha_salida = fecha_salida
         self.estado = "Activa"
+        self.id: Optional[int] = None
+
+    @property
+    def fecha_entrada(self) -> datetime:
+        return self._fecha_entrada
+
+    @fecha_entrada.setter
+    def fecha_entrada(self, valor: datetime):
+        self._fecha_entrada = valor
+        self._fecha_entrada_iso = valor.isoformat()
+
+    @property
+    def fecha_salida(self) -> datetime:
+        return self._fecha_salida
+
+    @fecha_salida.setter
+    def fecha_salida(self, valor: datetime):
+        self._fecha_salida = valor
+        self._fecha_salida_iso = valor.isoformat()
 
 class GestorHotel:
-    def __init__(self):
-        self.habitaciones: List[Habitacion] = []
+    def __init__(self, db_manager: Optional["DatabaseManager"] = None):
+        self.db_manager = db_manager
         self.clientes: List[Cliente] = []
         self.reservas: List[Reserva] = []
+        self._habitaciones_by_num: Dict[int, Habitacion] = {}
+        self._clientes_by_dpi: Dict[str, Cliente] = {}
+        # Solo se usa sin base de datos; con ella la disponibilidad depende de las fechas.
+        self._disponibles: Optional[Set[int]] = set() if db_manager is None else None
+
+    @property
+    def habitaciones(self) -> List[Habitacion]:
+        return list(self._habitaciones_by_num.values())
 
     def agregar_habitacion(self, habitacion: Habitacion):
-        self.habitaciones.append(habitacion)
+        if self._habitaciones_by_num.setdefault(habitacion.numero, habitacion) is habitacion:
+            self._marcar_disponible(habitacion, habitacion.disponible)
 
-    def modificar_habitacion(self, numero: int, nuevo_precio: float):
-        for habitacion in self.habitaciones:
-            if habitacion.numero == numero:
-                habitacion.precio_por_noche = nuevo_precio
-                return True
-        return False
+    def modificar_habitacion(self, numero: int, nuevo_precio: float) -> Optional[Habitacion]:
+        habitacion = self._habitaciones_by_num.get(numero)
+        if habitacion:
+            habitacion.precio_por_noche = nuevo_precio
+        return habitacion
 
     def eliminar_habitacion(self, numero: int):
-        self.habitaciones = [h for h in self.habitaciones if h.numero != numero]
+        self._habitaciones_by_num.pop(numero, None)
+        if self._disponibles is not None:
+            self._disponibles.discard(numero)
+
+    def _marcar_disponible(self, habitacion: Habitacion, disponible: bool):
+        habitacion.disponible = disponible
+        if self._disponibles is None or self._habitaciones_by_num.get(habitacion.numero) is not habitacion:
+            return
+        if disponible:
+            self._disponibles.add(habitacion.numero)
+        else:
+            self._disponibles.discard(habitacion.numero)
 
     def registrar_cliente(self, cliente: Cliente):
         self.clientes.append(cliente)
+        self._clientes_by_dpi.setdefault(cliente.dpi, cliente)
 
-    def actualizar_cliente(self, dpi: str, nuevos_nombres: str, nuevos_apellidos: str):
-        for cliente in self.clientes:
-            if cliente.dpi == dpi:
-                cliente.nombres = nuevos_nombres
-                cliente.apellidos = nuevos_apellidos
-                return True
-        return False
+    def actualizar_cliente(self, dpi: str, nuevos_nombres: str, nuevos_apellidos: str) -> Optional[Cliente]:
+        cliente = self._clientes_by_dpi.get(dpi)
+        if cliente:
+            cliente.nombres = nuevos_nombres
+            cliente.apellidos = nuevos_apellidos
+        return cliente
+
+    def _habitacion_libre(self, reserva: Reserva, entrada_iso: str, salida_iso: str) -> bool:
+        if self.db_manager is None:
+            return reserva.habitacion.disponible
+        return self.db_manager.habitacion_libre(reserva.habitacion.numero, entrada_iso, salida_iso, reserva.id)
 
     def crear_reserva(self, reserva: Reserva):
-        if reserva.habitacion.disponible:
-            reserva.habitacion.disponible = False
+        actual = reserva.cliente.reservas_by_hab.get(reserva.habitacion.numero)
+        if actual is not None and actual.estado == "Activa":
+            return False
+        if self._habitacion_libre(reserva, reserva._fecha_entrada_iso, reserva._fecha_salida_iso):
+            self._marcar_disponible(reserva.habitacion, False)
             self.reservas.append(reserva)
             reserva.cliente.reservas.append(reserva)
+            reserva.cliente.reservas_by_hab[reserva.habitacion.numero] = reserva
             return True
         return False
 
-    def modificar_reserva(self, cliente_dpi: str, numero_habitacion: int, nueva_fecha_entrada: datetime, nueva_fecha_salida: datetime):
-        for reserva in self.reservas:
-            if reserva.cliente.dpi == cliente_dpi and reserva.habitacion.numero == numero_habitacion:
-                reserva.fecha_entrada = nueva_fecha_entrada
-                reserva.fecha_salida = nueva_fecha_salida
-                return True
-        return False
-
-    def cancelar_reserva(self, cliente_dpi: str, numero_habitacion: int):
-        for reserva in self.reservas:
-            if reserva.cliente.dpi == cliente_dpi and reserva.habitacion.numero == numero_habitacion:
-                reserva.estado = "Cancelada"
-                reserva.habitacion.disponible = True
-                return True
-        return False
+    def _buscar_reserva(self, cliente_dpi: str, numero_habitacion: int) -> Optional[Reserva]:
+        cliente = self._clientes_by_dpi.get(cliente_dpi)
+        return cliente.reservas_by_hab.get(numero_habitacion) if cliente else None
+
+    def modificar_reserva(self, cliente_dpi: str, numero_habitacion: int, nueva_fecha_entrada: datetime, nueva_fecha_salida: datetime) -> Optional[Reserva]:
+        reserva = self._buscar_reserva(cliente_dpi, numero_habitacion)
+        if reserva is None:
+            return None
+        if (self.db_manager is not None and reserva.estado == "Activa"
+                and not self._habitacion_libre(reserva, nueva_fecha_entrada.isoformat(), nueva_fecha_salida.isoformat())):
+            return None
+        reserva.fecha_entrada = nueva_fecha_entrada
+        reserva.fecha_salida = nueva_fecha_salida
+        return reserva
+
+    def cancelar_reserva(self, cliente_dpi: str, numero_habitacion: int) -> Optional[Reserva]:
+        reserva = self._buscar_reserva(cliente_dpi, numero_habitacion)
+        if reserva:
+            reserva.estado = "Cancelada"
+            self._marcar_disponible(reserva.habitacion, True)
+        return reserva
 
     def consultar_disponibilidad(self, fecha_inicio: datetime, fecha_fin: datetime) -> List[Habitacion]:
-        return [h for h in self.habitaciones if h.disponible]
+        if self.db_manager is None:
+            return [self._habitaciones_by_num[numero] for numero in sorted(self._disponibles)]
+        filas = self.db_manager.habitaciones_disponibles(fecha_inicio.isoformat(), fecha_fin.isoformat())
+        return [self._habitaciones_by_num[numero] for numero, _, _ in filas if numero in self._habitaciones_by_num]
+
+    def habitaciones_por_tipo(self, tipo: str) -> List[Habitacion]:
+        return [h for h in self._habitaciones_by_num.values() if h.tipo == tipo]
+
+    def aplicar_descuento_por_tipo(self, tipo: str, factor: Optional[float] = None) -> List[Habitacion]:
+        if factor is None:
+            factor = _DESCUENTOS[tipo]
+        habitaciones = self.habitaciones_por_tipo(tipo)
+        for habitacion in habitaciones:
+            habitacion.precio_por_noche *= factor
+        if self.db_manager is not None:
+            self.db_manager.actualizar_habitaciones(habitaciones)
+        return habitaciones
 
     def obtener_cliente(self, dpi: str) -> Optional[Cliente]:
-        for cliente in self.clientes:
-            if cliente.dpi == dpi:
-                return cliente
-        return None
+        return self._clientes_by_dpi.get(dpi)
 
     def obtener_habitacion(self, numero: int) -> Optional[Habitacion]:
-        for habitacion in self.habitaciones:
-            if habitacion.numero == numero:
-                return habitacion
-        return None
+        return self._habitaciones_by_num.get(numero)
 
 class DatabaseManager:
+    _SQL_INS_HAB = "INSERT INTO habitaciones (numero, tipo, precio_por_noche, disponible) VALUES (?, ?, ?, ?)"
+    _SQL_UPD_HAB = "UPDATE habitaciones SET tipo = ?, precio_por_noche = ?, disponible = ? WHERE numero = ?"
+    _SQL_DEL_HAB = "DELETE FROM habitaciones WHERE numero = ?"
+    _SQL_INS_CLI = "INSERT INTO clientes (dpi, nombres, apellidos) VALUES (?, ?, ?)"
+    _SQL_UPD_CLI = "UPDATE clientes SET nombres = ?, apellidos = ? WHERE dpi = ?"
+    _SQL_INS_RES = ("INSERT INTO reservas (cliente_dpi, habitacion_numero, fecha_entrada, fecha_salida, estado) "
+                    "VALUES (?, ?, ?, ?, ?)")
+    _SQL_UPD_RES = "UPDATE reservas SET fecha_entrada = ?, fecha_salida = ?, estado = ? WHERE id = ?"
+    _SQL_OCUPADA = ("SELECT 1 FROM reservas WHERE habitacion_numero = ? AND estado = 'Activa' "
+                    "AND NOT (fecha_salida <= ? OR fecha_entrada >= ?) AND id IS NOT ? LIMIT 1")
+    _SQL_DISPONIBLES = ("SELECT numero, tipo, precio_por_noche FROM habitaciones h WHERE NOT EXISTS ("
+                        "SELECT 1 FROM reservas r WHERE r.habitacion_numero = h.numero AND r.estado = 'Activa' "
+                        "AND NOT (r.fecha_salida <= ? OR r.fecha_entrada >= ?)) ORDER BY numero")
+
     def __init__(self, db_name: str):
         self.db_name = db_name
         self.conn: Optional[sqlite3.Connection] = None
+        self._cur: Optional[sqlite3.Cursor] = None
+        self._tablas_listas = False
 
     def conectar(self):
-        self.conn = sqlite3.connect(self.db_name)
+        if self.conn is not None:
+            return
+        self.conn = sqlite3.connect(self.db_name, cached_statements=128)
+        self.conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-20000;"
+            "PRAGMA mmap_size=268435456;"
+        )
+        self._cur = self.conn.cursor()
 
     def desconectar(self):
+        if self._cur:
+            self._cur.close()
+            self._cur = None
         if self.conn:
             self.conn.close()
+            self.conn = None
+        self._tablas_listas = False
+
+    def _abrir(self):
+        if self.conn is None:
+            self.conectar()
+        if not self._tablas_listas:
+            self.crear_tablas()
 
     def crear_tablas(self):
-        cursor = self.conn.cursor()
+        if self.conn is None:
+            self.conectar()
+        cursor = self._cur
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS habitaciones (
                 numero INTEGER PRIMARY KEY,
@@ -160,107 +252,175 @@ class DatabaseManager:
                 FOREIGN KEY (habitacion_numero) REFERENCES habitaciones (numero)
             )
         ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_reservas_cli_hab ON reservas (cliente_dpi, habitacion_numero)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_reservas_estado ON reservas (estado)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_reservas_hab_estado ON reservas (habitacion_numero, estado)')
+        cursor.execute('ANALYZE')
         self.conn.commit()
+        self._tablas_listas = True
+
+    def begin(self):
+        self._abrir()
+        if not self.conn.in_transaction:
+            self._cur.execute("BEGIN")
+
+    def commit(self):
+        if self.conn:
+            self.conn.commit()
+
+    def rollback(self):
+        if self.conn:
+            self.conn.rollback()
+
+    @contextmanager
+    def transaction(self):
+        self._abrir()
+        if self.conn.in_transaction:
+            yield
+            return
+        self._cur.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
 
     def insertar_habitacion(self, habitacion: Habitacion):
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO habitaciones (numero, tipo, precio_por_noche, disponible)
-            VALUES (?, ?, ?, ?)
-        ''', (habitacion.numero, habitacion.tipo, habitacion.precio_por_noche, int(habitacion.disponible)))
-        self.conn.commit()
+        self._abrir()
+        self._cur.execute(self._SQL_INS_HAB, (habitacion.numero, habitacion.tipo, habitacion.precio_por_noche,
+                                              int(habitacion.disponible)))
+
+    def insertar_habitaciones(self, habitaciones: Iterable[Habitacion]):
+        with self.transaction():
+            self._cur.executemany(self._SQL_INS_HAB, [(h.numero, h.tipo, h.precio_por_noche, int(h.disponible))
+                                                      for h in habitaciones])
 
     def actualizar_habitacion(self, habitacion: Habitacion):
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE habitaciones
-            SET tipo = ?, precio_por_noche = ?, disponible = ?
-            WHERE numero = ?
-        ''', (habitacion.tipo, habitacion.precio_por_noche, int(habitacion.disponible), habitacion.numero))
-        self.conn.commit()
+        self._abrir()
+        self._cur.execute(self._SQL_UPD_HAB, (habitacion.tipo, habitacion.precio_por_noche, int(habitacion.disponible),
+                                              habitacion.numero))
+
+    def actualizar_habitaciones(self, habitaciones: Iterable[Habitacion]):
+        with self.transaction():
+            self._cur.executemany(self._SQL_UPD_HAB, [(h.tipo, h.precio_por_noche, int(h.disponible), h.numero)
+                                                      for h in habitaciones])
 
     def eliminar_habitacion(self, numero: int):
-        cursor = self.conn.cursor()
-        cursor.execute('DELETE FROM habitaciones WHERE numero = ?', (numero,))
-        self.conn.commit()
+        self._abrir()
+        self._cur.execute(self._SQL_DEL_HAB, (numero,))
 
     def insertar_cliente(self, cliente: Cliente):
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO clientes (dpi, nombres, apellidos)
-            VALUES (?, ?, ?)
-        ''', (cliente.dpi, cliente.nombres, cliente.apellidos))
-        self.conn.commit()
+        self._abrir()
+        self._cur.execute(self._SQL_INS_CLI, (cliente.dpi, cliente.nombres, cliente.apellidos))
+
+    def insertar_clientes(self, clientes: Iterable[Cliente]):
+        with self.transaction():
+            self._cur.executemany(self._SQL_INS_CLI, [(c.dpi, c.nombres, c.apellidos) for c in clientes])
 
     def actualizar_cliente(self, cliente: Cliente):
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE clientes
-            SET nombres = ?, apellidos = ?
-            WHERE dpi = ?
-        ''', (cliente.nombres, cliente.apellidos, cliente.dpi))
-        self.conn.commit()
+        self._abrir()
+        self._cur.execute(self._SQL_UPD_CLI, (cliente.nombres, cliente.apellidos, cliente.dpi))
 
     def insertar_reserva(self, reserva: Reserva):
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            INSERT INTO reservas (cliente_dpi, habitacion_numero, fecha_entrada, fecha_salida, estado)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (reserva.cliente.dpi, reserva.habitacion.numero, reserva.fecha_entrada.isoformat(),
-              reserva.fecha_salida.isoformat(), reserva.estado))
-        self.conn.commit()
+        self._abrir()
+        self._cur.execute(self._SQL_INS_RES, (reserva.cliente.dpi, reserva.habitacion.numero,
+                                              reserva._fecha_entrada_iso, reserva._fecha_salida_iso,
+                                              reserva.estado))
+        reserva.id = self._cur.lastrowid
+
+    def insertar_reservas(self, reservas: Iterable[Reserva]):
+        reservas = list(reservas)
+        with self.transaction():
+            self._cur.executemany(self._SQL_INS_RES, [(r.cliente.dpi, r.habitacion.numero, r._fecha_entrada_iso,
+                                                       r._fecha_salida_iso, r.estado) for r in reservas])
+            # Dentro de la misma transacción los ids de AUTOINCREMENT son consecutivos.
+            ultimo_id = self._cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+        for reserva_id, reserva in enumerate(reservas, ultimo_id - len(reservas) + 1):
+            reserva.id = reserva_id
 
     def actualizar_reserva(self, reserva: Reserva):
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            UPDATE reservas
-            SET fecha_entrada = ?, fecha_salida = ?, estado = ?
-            WHERE cliente_dpi = ? AND habitacion_numero = ?
-        ''', (reserva.fecha_entrada.isoformat(), reserva.fecha_salida.isoformat(), reserva.estado,
-              reserva.cliente.dpi, reserva.habitacion.numero))
-        self.conn.commit()
+        self._abrir()
+        self._cur.execute(self._SQL_UPD_RES, (reserva._fecha_entrada_iso, reserva._fecha_salida_iso, reserva.estado,
+                                              reserva.id))
+
+    def habitacion_libre(self, numero: int, inicio_iso: str, fin_iso: str, excluir_id: Optional[int] = None) -> bool:
+        self._abrir()
+        return self._cur.execute(self._SQL_OCUPADA, (numero, inicio_iso, fin_iso, excluir_id)).fetchone() is None
+
+    def habitaciones_disponibles(self, inicio_iso: str, fin_iso: str) -> List[Tuple[int, str, float]]:
+        self._abrir()
+        return self._cur.execute(self._SQL_DISPONIBLES, (inicio_iso, fin_iso)).fetchall()
+
+def _parse_ymd(texto: str) -> datetime:
+    anio, mes, dia = texto[0:4], texto[5:7], texto[8:10]
+    if (len(texto) != 10 or texto[4] != "-" or texto[7] != "-" or not texto.isascii()
+            or not (anio.isdigit() and mes.isdigit() and dia.isdigit())):
+        raise ValueError(f"fecha '{texto}' no coincide con el formato YYYY-MM-DD")
+    return datetime(int(anio), int(mes), int(dia))
+
+_MENU_PRINCIPAL = (
+    "\n--- Menú Principal del Hotel ---\n"
+    "1. Registro de habitaciones\n"
+    "2. Registro de clientes\n"
+    "3. Registro de reservas\n"
+    "4. Consultar disponibilidad de habitaciones\n"
+    "5. Ver información de cliente y sus reservas\n"
+    "6. Salir\n"
+    "Seleccione una opción: "
+)
+
+_SUBMENU_HABITACIONES = (
+    "\n--- Submenu de Habitaciones ---\n"
+    "1. Registrar nueva habitación\n"
+    "2. Modificar habitación\n"
+    "3. Eliminar habitación\n"
+    "4. Volver al menú principal\n"
+    "Seleccione una opción: "
+)
+
+_SUBMENU_CLIENTES = (
+    "\n--- Submenu de Clientes ---\n"
+    "1. Registrar nuevo cliente\n"
+    "2. Actualizar información de cliente\n"
+    "3. Volver al menú principal\n"
+    "Seleccione una opción: "
+)
+
+_SUBMENU_RESERVAS = (
+    "\n--- Submenu de Reservas ---\n"
+    "1. Realizar reserva\n"
+    "2. Modificar reserva\n"
+    "3. Cancelar reserva\n"
+    "4. Volver al menú principal\n"
+    "Seleccione una opción: "
+)
 
 def mostrar_menu_principal():
-    print("\n--- Menú Principal del Hotel ---")
-    print("1. Registro de habitaciones")
-    print("2. Registro de clientes")
-    print("3. Registro de reservas")
-    print("4. Consultar disponibilidad de habitaciones")
-    print("5. Ver información de cliente y sus reservas")
-    print("6. Salir")
-    return input("Seleccione una opción: ")
+    sys.stdout.write(_MENU_PRINCIPAL)
+    sys.stdout.flush()
+    return input()
 
 def mostrar_submenu_habitaciones():
-    print("\n--- Submenu de Habitaciones ---")
-    print("1. Registrar nueva habitación")
-    print("2. Modificar habitación")
-    print("3. Eliminar habitación")
-    print("4. Volver al menú principal")
-    return input("Seleccione una opción: ")
+    sys.stdout.write(_SUBMENU_HABITACIONES)
+    sys.stdout.flush()
+    return input()
 
 def mostrar_submenu_clientes():
-    print("\n--- Submenu de Clientes ---")
-    print("1. Registrar nuevo cliente")
-    print("2. Actualizar información de cliente")
-    print("3. Volver al menú principal")
-    return input("Seleccione una opción: ")
+    sys.stdout.write(_SUBMENU_CLIENTES)
+    sys.stdout.flush()
+    return input()
 
 def mostrar_submenu_reservas():
-    print("\n--- Submenu de Reservas ---")
-    print("1. Realizar reserva")
-    print("2. Modificar reserva")
-    print("3. Cancelar reserva")
-    print("4. Volver al menú principal")
-    return input("Seleccione una opción: ")
+    sys.stdout.write(_SUBMENU_RESERVAS)
+    sys.stdout.flush()
+    return input()
 
 def main():
-    gestor = GestorHotel()
     db_manager = DatabaseManager("hotel.db")
+    gestor = GestorHotel(db_manager)
 
     try:
-        db_manager.conectar()
-        db_manager.crear_tablas()
-
         while True:
             opcion_principal = mostrar_menu_principal()
 
@@ -271,34 +431,29 @@ def main():
                         numero = int(input("Número de habitación: "))
                         tipo = input("Tipo de habitación (1: Estándar, 2: Suite, 3: Deluxe): ")
                         precio = float(input("Precio por noche: "))
-                        if tipo == "1":
-                            habitacion = HabitacionEstandar(numero, precio)
-                        elif tipo == "2":
-                            habitacion = HabitacionSuite(numero, precio)
-                        elif tipo == "3":
-                            habitacion = HabitacionDeluxe(numero, precio)
-                        else:
+                        if tipo not in ("1", "2", "3"):
                             print("Tipo de habitación no válido.")
                             continue
+                        habitacion = Habitacion(numero, _TIPOS[int(tipo) - 1], precio)
                         gestor.agregar_habitacion(habitacion)
-                        db_manager.insertar_habitacion(habitacion)
+                        with db_manager.transaction():
+                            db_manager.insertar_habitacion(habitacion)
                         print("Habitación registrada con éxito.")
                     elif opcion_habitaciones == "2":  # Modificar habitación
                         numero = int(input("Número de habitación a modificar: "))
                         nuevo_precio = float(input("Nuevo precio por noche: "))
-                        if gestor.modificar_habitacion(numero, nuevo_precio):
-                            habitacion = gestor.obtener_habitacion(numero)
-                            if habitacion:
+                        habitacion = gestor.modificar_habitacion(numero, nuevo_precio)
+                        if habitacion:
+                            with db_manager.transaction():
                                 db_manager.actualizar_habitacion(habitacion)
-                                print("Habitación modificada con éxito.")
-                            else:
-                                print("Error al actualizar la habitación en la base de datos.")
+                            print("Habitación modificada con éxito.")
                         else:
                             print("No se encontró la habitación.")
                     elif opcion_habitaciones == "3":  # Eliminar habitación
                         numero = int(input("Número de habitación a eliminar: "))
                         gestor.eliminar_habitacion(numero)
-                        db_manager.eliminar_habitacion(numero)
+                        with db_manager.transaction():
+                            db_manager.eliminar_habitacion(numero)
                         print("Habitación eliminada con éxito.")
                     elif opcion_habitaciones == "4":  # Volver al menú principal
                         break
@@ -314,19 +469,18 @@ def main():
                         dpi = input("DPI del cliente: ")
                         cliente = Cliente(nombres, apellidos, dpi)
                         gestor.registrar_cliente(cliente)
-                        db_manager.insertar_cliente(cliente)
+                        with db_manager.transaction():
+                            db_manager.insertar_cliente(cliente)
                         print("Cliente registrado con éxito.")
                     elif opcion_clientes == "2":  # Actualizar información de cliente
                         dpi = input("DPI del cliente a actualizar: ")
                         nuevos_nombres = input("Nuevos nombres: ")
                         nuevos_apellidos = input("Nuevos apellidos: ")
-                        if gestor.actualizar_cliente(dpi, nuevos_nombres, nuevos_apellidos):
-                            cliente = gestor.obtener_cliente(dpi)
-                            if cliente:
+                        cliente = gestor.actualizar_cliente(dpi, nuevos_nombres, nuevos_apellidos)
+                        if cliente:
+                            with db_manager.transaction():
                                 db_manager.actualizar_cliente(cliente)
-                                print("Información del cliente actualizada con éxito.")
-                            else:
-                                print("Error al actualizar el cliente en la base de datos.")
+                            print("Información del cliente actualizada con éxito.")
                         else:
                             print("No se encontró el cliente.")
                     elif opcion_clientes == "3":  # Volver al menú principal
@@ -340,8 +494,8 @@ def main():
                     if opcion_reservas == "1":  # Realizar reserva
                         dpi_cliente = input("DPI del cliente: ")
                         numero_habitacion = int(input("Número de habitación: "))
-                        fecha_entrada = datetime.strptime(input("Fecha de entrada (YYYY-MM-DD): "), "%Y-%m-%d")
-                        fecha_salida = datetime.strptime(input("Fecha de  salida (YYYY-MM-DD): "), "%Y-%m-%d")
+                        fecha_entrada = _parse_ymd(input("Fecha de entrada (YYYY-MM-DD): "))
+                        fecha_salida = _parse_ymd(input("Fecha de  salida (YYYY-MM-DD): "))
                         
                         cliente = gestor.obtener_cliente(dpi_cliente)
                         habitacion = gestor.obtener_habitacion(numero_habitacion)
@@ -349,7 +503,8 @@ def main():
                         if cliente and habitacion:
                             reserva = Reserva(cliente, habitacion, fecha_entrada, fecha_salida)
                             if gestor.crear_reserva(reserva):
-                                db_manager.insertar_reserva(reserva)
+                                with db_manager.transaction():
+                                    db_manager.insertar_reserva(reserva)
                                 print("Reserva creada con éxito.")
                             else:
                                 print("No se pudo crear la reserva. La habitación no está disponible.")
@@ -358,25 +513,23 @@ def main():
                     elif opcion_reservas == "2":  # Modificar reserva
                         dpi_cliente = input("DPI del cliente: ")
                         numero_habitacion = int(input("Número de habitación: "))
-                        nueva_fecha_entrada = datetime.strptime(input("Nueva fecha de entrada (YYYY-MM-DD): "), "%Y-%m-%d")
-                        nueva_fecha_salida = datetime.strptime(input("Nueva fecha de salida (YYYY-MM-DD): "), "%Y-%m-%d")
+                        nueva_fecha_entrada = _parse_ymd(input("Nueva fecha de entrada (YYYY-MM-DD): "))
+                        nueva_fecha_salida = _parse_ymd(input("Nueva fecha de salida (YYYY-MM-DD): "))
                         
-                        if gestor.modificar_reserva(dpi_cliente, numero_habitacion, nueva_fecha_entrada, nueva_fecha_salida):
-                            for reserva in gestor.reservas:
-                                if reserva.cliente.dpi == dpi_cliente and reserva.habitacion.numero == numero_habitacion:
-                                    db_manager.actualizar_reserva(reserva)
-                                    break
+                        reserva = gestor.modificar_reserva(dpi_cliente, numero_habitacion, nueva_fecha_entrada, nueva_fecha_salida)
+                        if reserva:
+                            with db_manager.transaction():
+                                db_manager.actualizar_reserva(reserva)
                             print("Reserva modificada con éxito.")
                         else:
-                            print("No se encontró la reserva.")
+                            print("No se encontró la reserva o la habitación no está disponible en esas fechas.")
                     elif opcion_reservas == "3":  # Cancelar reserva
                         dpi_cliente = input("DPI del cliente: ")
                         numero_habitacion = int(input("Número de habitación: "))
-                        if gestor.cancelar_reserva(dpi_cliente, numero_habitacion):
-                            for reserva in gestor.reservas:
-                                if reserva.cliente.dpi == dpi_cliente and reserva.habitacion.numero == numero_habitacion:
-                                    db_manager.actualizar_reserva(reserva)
-                                    break
+                        reserva = gestor.cancelar_reserva(dpi_cliente, numero_habitacion)
+                        if reserva:
+                            with db_manager.transaction():
+                                db_manager.actualizar_reserva(reserva)
                             print("Reserva cancelada con éxito.")
                         else:
                             print("No se encontró la reserva.")
@@ -386,8 +539,8 @@ def main():
                         print("Opción no válida. Por favor, intente de nuevo.")
 
             elif opcion_principal == "4":  # Consultar disponibilidad de habitaciones
-                fecha_inicio = datetime.strptime(input("Fecha de inicio (YYYY-MM-DD): "), "%Y-%m-%d")
-                fecha_fin = datetime.strptime(input("Fecha de fin (YYYY-MM-DD): "), "%Y-%m-%d")
+                fecha_inicio = _parse_ymd(input("Fecha de inicio (YYYY-MM-DD): "))
+                fecha_fin = _parse_ymd(input("Fecha de fin (YYYY-MM-DD): "))
                 
                 habitaciones_disponibles = gestor.consultar_disponibilidad(fecha_inicio, fecha_fin)
                 print("Habitaciones disponibles:")